@@ -13,6 +13,7 @@ from app.config import UserConfig
 
 from app.db.userdata import UserTable
 from app.settings import Info as AppInfo
+from app.utils.jsonprovider import OrjsonProvider
 from .plugins import lyrics as lyrics_plugin
 from app.api import (
     album,
@@ -64,6 +65,11 @@ def create_api():
     )
 
     app = OpenAPI(__name__, info=api_info, doc_prefix="/docs")
+    # JSON ENCODING
+    app.json = OrjsonProvider(app)
+    app.json.sort_keys = False
+    app.json.compact = True
+
     # JWT CONFIGS
     app.config["JWT_SECRET_KEY"] = UserConfig().serverId
     app.config["JWT_TOKEN_LOCATION"] = ["cookies", "headers"]
@@ -78,10 +84,14 @@ def create_api():
 
     # RESPONSE COMPRESSION
     # Only compress JSON responses
-    Compress(app)
+    # NOTE: Algorithms are read on init, so set them before calling Compress(app)
     app.config["COMPRESS_MIMETYPES"] = [
         "application/json",
     ]
+    app.config["COMPRESS_ALGORITHM"] = ["br", "gzip"]
+    app.config["COMPRESS_BR_LEVEL"] = 5
+    app.config["COMPRESS_MIN_SIZE"] = 500
+    Compress(app)
 
     # JWT
     jwt = JWTManager(app)
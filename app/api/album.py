@@ -2,7 +2,6 @@
 Contains all the album routes.
 """
 
-from dataclasses import asdict
 import random
 
 from pydantic import BaseModel, Field
@@ -19,7 +18,7 @@ from app.store.artists import ArtistStore
 from app.store.tracks import TrackStore
 from app.utils.hashing import create_hash
 from app.lib.albumslib import sort_by_track_no
-from app.serializers.album import serialize_for_card_many
+from app.serializers.album import album_to_dict, serialize_for_card_many
 from app.serializers.track import serialize_tracks
 
 
@@ -43,18 +42,27 @@ def get_album_tracks_and_info(body: AlbumHashSchema):
 
     album = albumentry.album
     tracks = TrackStore.get_tracks_by_trackhashes(albumentry.trackhashes)
+    duration = 0
+    bitrate = 0
+    track_totals: set[int] = set()
+
+    for t in tracks:
+        duration += t.duration
+        bitrate += t.bitrate
+        track_totals.add(int(t.extra.get("track_total", 1) or 1))
+
     album.trackcount = len(tracks)
-    album.duration = sum(t.duration for t in tracks)
+    album.duration = duration
     album.check_type(
         tracks=tracks, singleTrackAsSingle=UserConfig().showAlbumsAsSingles
     )
 
-    track_total = sum({int(t.extra.get("track_total", 1) or 1) for t in tracks})
-    avg_bitrate = sum(t.bitrate for t in tracks) // (len(tracks) or 1)
+    track_total = sum(track_totals)
+    avg_bitrate = bitrate // (len(tracks) or 1)
 
     return {
         "info": {
-            **asdict(album),
+            **album_to_dict(album),
             "is_favorite": album.is_favorite,
         },
         "extra": {
@@ -113,6 +121,7 @@ def get_more_from_artist(body: GetMoreFromArtistsBody):
         all_albums[artisthash] = AlbumStore.get_albums_by_artisthash(artisthash)
 
     seen_hashes = set()
+    base_title_hash = create_hash(base_title)
 
     for artisthash, albums in all_albums.items():
         albums = [
@@ -121,14 +130,10 @@ def get_more_from_artist(body: GetMoreFromArtistsBody):
             # INFO: filter out albums added to other artists
             if a.albumhash not in seen_hashes and artisthash in a.artisthashes
             # INFO: filter out albums with the same base title
-            and create_hash(a.base_title) != create_hash(base_title)
+            and create_hash(a.base_title) != base_title_hash
         ]
 
-        all_albums[artisthash] = serialize_for_card_many(
-            [a for a in albums if create_hash(a.base_title) != create_hash(base_title)][
-                :limit
-            ]
-        )
+        all_albums[artisthash] = serialize_for_card_many(albums[:limit])
         # INFO: record albums added to other artists
         seen_hashes.update([a.albumhash for a in albums][:limit])
 
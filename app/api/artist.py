@@ -5,7 +5,6 @@ Contains all the artist(s) routes.
 import math
 import random
 from datetime import datetime
-from itertools import groupby
 
 from flask_openapi3 import APIBlueprint, Tag
 from pydantic import Field
@@ -25,7 +24,7 @@ from app.serializers.artist import serialize_for_cards, serialize_for_card
 from app.serializers.track import serialize_track
 
 from app.store.albums import AlbumStore
-from app.store.artists import ArtistStore
+from app.store.artists import ArtistMapEntry, ArtistStore
 from app.store.tracks import TrackStore
 
 bp_tag = Tag(name="Artist", description="Single artist")
@@ -69,7 +68,10 @@ def get_artist(path: ArtistHashSchema, query: TrackLimitSchema):
     if decade:
         artist.genres.insert(0, {"name": decade, "genrehash": decade})
 
-    duration = sum(t.duration for t in tracks) if tracks else 0
+    duration = 0
+    for t in tracks:
+        duration += t.duration
+
     tracks = [
         {
             **serialize_track(t),
@@ -97,68 +99,91 @@ class GetArtistAlbumsQuery(AlbumLimitSchema):
     )
 
 
-@api.get("/<artisthash>/albums")
-def get_artist_albums(path: ArtistHashSchema, query: GetArtistAlbumsQuery):
+def group_artist_albums(artisthash: str, entry: ArtistMapEntry):
     """
-    Get artist albums.
+    Returns the albums of the given artist grouped into albums,
+    appearances, compilations and singles/EPs, newest first.
     """
-    return_all = query.all
-    artisthash = path.artisthash
-
-    limit = query.limit
-
-    entry = ArtistStore.artistmap.get(artisthash)
-
-    if entry is None:
-        return {"error": "Artist not found"}, 404
-
-    albums = AlbumStore.get_albums_by_hashes(entry.albumhashes)
     tracks = TrackStore.get_tracks_by_trackhashes(entry.trackhashes)
+    missing_albumhashes = {t.albumhash for t in tracks}.difference(entry.albumhashes)
 
-    missing_albumhashes = {
-        t.albumhash for t in tracks if t.albumhash not in {a.albumhash for a in albums}
-    }
-
-    albums.extend(AlbumStore.get_albums_by_hashes(missing_albumhashes))
+    # INFO: Fetch the artist albums and the missing albums in a single lookup
+    albums = AlbumStore.get_albums_by_hashes(entry.albumhashes | missing_albumhashes)
     albumdict = {a.albumhash: a for a in albums}
 
     config = UserConfig()
-    albumgroups = groupby(tracks, key=lambda t: t.albumhash)
-    for albumhash, tracks in albumgroups:
-        album = albumdict.get(albumhash)
+    for album in albumdict.values():
+        if album._type_checked:
+            continue
 
-        if album:
-            album.check_type(list(tracks), config.showAlbumsAsSingles)
+        # INFO: Check the type against all the album tracks, not just this
+        # artist's, as the result is remembered on the shared album object
+        album_tracks = AlbumStore.get_album_tracks(album.albumhash)
+        album.check_type(album_tracks, config.showAlbumsAsSingles)
 
-    albums = [a for a in albumdict.values()]
-    all_albums = sorted(albums, key=lambda a: a.date, reverse=True)
+    all_albums = sorted(albumdict.values(), key=lambda a: a.date, reverse=True)
 
-    res = {
-        "albums": [],
-        "appearances": [],
-        "compilations": [],
-        "singles_and_eps": [],
-    }
+    # INFO: Sort the albums into their buckets in a single pass
+    albums, appearances, compilations, singles_and_eps = [], [], [], []
 
     for album in all_albums:
-        if album.type == "single" or album.type == "ep":
-            res["singles_and_eps"].append(album)
+        if album.type in ("single", "ep"):
+            singles_and_eps.append(album)
         elif album.type == "compilation":
-            res["compilations"].append(album)
+            compilations.append(album)
         elif (
             album.albumhash in missing_albumhashes
             or artisthash not in album.artisthashes
         ):
-            res["appearances"].append(album)
+            appearances.append(album)
         else:
-            res["albums"].append(album)
+            albums.append(album)
+
+    return {
+        "albums": albums,
+        "appearances": appearances,
+        "compilations": compilations,
+        "singles_and_eps": singles_and_eps,
+    }
+
+
+def get_grouped_artist_albums(artisthash: str, entry: ArtistMapEntry):
+    """
+    Returns the grouped artist albums from the cache,
+    grouping and caching them on a miss.
+    """
+    groups = ArtistStore.get_cached_albums(artisthash)
+
+    if groups is None:
+        groups = group_artist_albums(artisthash, entry)
+        ArtistStore.cache_albums(artisthash, groups)
+
+    return groups
+
+
+@api.get("/<artisthash>/albums")
+def get_artist_albums(path: ArtistHashSchema, query: GetArtistAlbumsQuery):
+    """
+    Get artist albums.
+    """
+    return_all = query.all
+    artisthash = path.artisthash
+
+    limit = query.limit
+
+    entry = ArtistStore.artistmap.get(artisthash)
+
+    if entry is None:
+        return {"error": "Artist not found"}, 404
+
+    groups = get_grouped_artist_albums(artisthash, entry)
 
     if return_all:
-        limit = len(all_albums)
+        limit = sum(len(albums) for albums in groups.values())
 
-    # loop through the res dict and serialize the albums
-    for key, value in res.items():
-        res[key] = serialize_for_card_many(value[:limit])
+    res = {
+        key: serialize_for_card_many(albums[:limit]) for key, albums in groups.items()
+    }
 
     res["artistname"] = entry.artist.name
     return res
@@ -23,6 +23,7 @@ from app.models.playlist import Playlist
 from app.serializers.playlist import serialize_for_card
 from app.serializers.track import serialize_tracks
 
+from app.store.albums import AlbumStore
 from app.store.tracks import TrackStore
 from app.utils.dates import create_new_date, date_string_to_time_passed
 from app.settings import Paths
@@ -66,7 +67,7 @@ def get_album_trackhashes(albumhash: str):
     """
     Returns a list of trackhashes in an album.
     """
-    tracks = TrackStore.get_tracks_by_albumhash(albumhash)
+    tracks = AlbumStore.get_album_tracks(albumhash)
     tracks = sort_by_track_no(tracks)
 
     return [t.trackhash for t in tracks]
@@ -15,7 +15,9 @@ def track_to_dataclass(track: Any, config: UserConfig):
 
 
 def tracks_to_dataclasses(tracks: Any):
-    return [track_to_dataclass(track, UserConfig()) for track in tracks]
+    # INFO: Read the config file once for the whole batch
+    config = UserConfig()
+    return [track_to_dataclass(track, config) for track in tracks]
 
 
 def album_to_dataclass(album: Any):
@@ -2,7 +2,7 @@
 This library contains all the functions related to the search functionality.
 """
 
-from typing import Any, Generator, List, TypeVar
+from typing import List, TypeVar
 
 from rapidfuzz import process, utils
 from unidecode import unidecode
@@ -143,20 +143,6 @@ _S2 = TypeVar("_S2")
 _ResultType = int | float
 
 
-def get_titles(items: list[_type]):
-    for item in items:
-        if isinstance(item, models.Track):
-            text = item.og_title
-        elif isinstance(item, models.Album):
-            text = item.title
-        elif isinstance(item, models.Artist):
-            text = item.name
-        else:
-            text = None
-
-        yield text
-
-
 class TopResults:
     """
     Joins all tracks, albums and artists
@@ -165,18 +151,28 @@ class TopResults:
 
     @staticmethod
     def collect_all():
+        """
+        Collects all searchable items and their titles in one pass per store.
+        """
         all_items: list[_type] = []
+        titles: list[str] = []
 
-        all_items.extend(ArtistStore.get_flat_list())
-        all_items.extend(TrackStore.get_flat_list())
-        all_items.extend(TrackStore.get_flat_list())
+        for artist in ArtistStore.get_flat_list():
+            all_items.append(artist)
+            titles.append(artist.name)
 
-        return all_items, get_titles(all_items)
+        for track in TrackStore.get_flat_list():
+            all_items.append(track)
+            titles.append(track.og_title)
 
-    @staticmethod
-    def get_results(items: Generator[str, Any, None], query: str):
-        items = list(items)
+        for album in AlbumStore.get_flat_list():
+            all_items.append(album)
+            titles.append(album.title)
+
+        return all_items, titles
 
+    @staticmethod
+    def get_results(items: list[str], query: str):
         results = process.extract(
             query=query, choices=items, score_cutoff=Cutoff.tracks, limit=1
         )
@@ -192,17 +188,17 @@ class TopResults:
             return {"type": "track", "item": item}
 
         if isinstance(item, models.Album):
-            tracks = TrackStore.get_tracks_by_albumhash(item.albumhash)
-            tracks = remove_duplicates(tracks)
+            tracks = AlbumStore.get_album_tracks(item.albumhash)
 
             try:
                 item.duration = sum((t.duration for t in tracks))
             except AttributeError:
                 item.duration = 0
 
-            item.check_type(
-                tracks, singleTrackAsSingle=UserConfig().showAlbumsAsSingles
-            )
+            if not item._type_checked:
+                item.check_type(
+                    tracks, singleTrackAsSingle=UserConfig().showAlbumsAsSingles
+                )
 
             return {"type": "album", "item": item}
 
@@ -227,7 +223,7 @@ class TopResults:
             tracks.extend(SearchTracks(query)())
 
         if item["type"] == "album":
-            t = TrackStore.get_tracks_by_albumhash(item["item"].albumhash)
+            t = AlbumStore.get_album_tracks(item["item"].albumhash)
             t.sort(key=lambda x: x.last_mod)
 
             # if there are less than the limit, get more tracks
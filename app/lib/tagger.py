@@ -9,7 +9,6 @@ from app.models.artist import Artist
 from app.models.track import Track
 from app.store.folder import FolderStore
 from app.store.tracks import TrackStore
-from app.utils import flatten
 from app.utils.filesystem import run_fast_scandir
 from app.utils.parsers import get_base_album_title
 from app.utils.progressbar import tqdm
@@ -228,9 +227,13 @@ def create_artists(
     >>> list[tuple[Artist, set[str], set[str]]]
     """
     if artisthashes:
-        all_tracks: list[Track] = flatten(
-            [TrackStore.get_tracks_by_artisthash(hash) for hash in artisthashes]
-        )
+        # INFO: Collect the tracks for all the artists in a single pass
+        hash_set = set(artisthashes)
+        all_tracks: list[Track] = [
+            t
+            for t in TrackStore.get_flat_list()
+            if not hash_set.isdisjoint(t.artisthashes)
+        ]
     else:
         all_tracks: list[Track] = TrackStore.get_flat_list()
 
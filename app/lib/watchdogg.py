@@ -164,6 +164,8 @@ def add_track(filepath: str) -> None:
 
     # if the track is somehow invalid, return
     if tags is None or tags["bitrate"] == 0 or tags["duration"] == 0:
+        # INFO: An older version of the track may have been removed above
+        ArtistStore.clear_albums_cache()
         return
 
     TrackTable.insert_one(tags)
@@ -185,6 +187,7 @@ def add_track(filepath: str) -> None:
         if not trackhash_exists:
             albumentry.trackhashes.add(track.trackhash)
             albumentry.album.trackcount += 1
+            albumentry.album._type_checked = False
             albumentry.set_color(colors[0]) if colors else None
 
     # SECTION: Index artist
@@ -197,6 +200,9 @@ def add_track(filepath: str) -> None:
             trackhashes=artist[2],
         )
 
+    # INFO: Other artists on the album may have its old type cached
+    ArtistStore.clear_albums_cache()
+
 
 def remove_track(filepath: str) -> None:
     """
@@ -209,6 +215,7 @@ def remove_track(filepath: str) -> None:
 
     db.remove_tracks_by_filepaths(filepath)
     TrackStore.remove_track_by_filepath(filepath)
+    ArtistStore.clear_albums_cache()
 
     empty_album = TrackStore.count_tracks_by_trackhash(track.albumhash) > 0
 
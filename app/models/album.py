@@ -37,6 +37,10 @@ class Album:
     versions: list[str] = dataclasses.field(default_factory=list)
     fav_userids: list[int] = dataclasses.field(default_factory=list)
 
+    # INFO: Set once the album type has been determined, so that
+    # requests can skip re-running the checks for this album object.
+    _type_checked: bool = False
+
     @property
     def is_favorite(self):
         return get_current_userid() in self.fav_userids
@@ -70,7 +74,12 @@ class Album:
     def check_type(self, tracks: list[Track], singleTrackAsSingle: bool):
         """
         Runs all the checks to determine the type of album.
+
+        The result is remembered on the album object, so `tracks` should
+        be all the tracks in the album.
         """
+        self._type_checked = True
+
         if self.is_single(tracks, singleTrackAsSingle):
             self.type = "single"
             return
@@ -98,8 +107,10 @@ class Album:
         Checks if the album is a soundtrack.
         """
         keywords = ["motion picture", "soundtrack"]
+        title = self.og_title.lower()
+
         for keyword in keywords:
-            if keyword in self.og_title.lower():
+            if keyword in title:
                 return True
 
         return False
@@ -130,8 +141,10 @@ class Album:
             "compilation",
         }
 
+        title = self.title.lower()
+
         for substring in substrings:
-            if substring in self.title.lower():
+            if substring in title:
                 return True
 
         return False
@@ -141,8 +154,10 @@ class Album:
         Checks if the album is a live album.
         """
         keywords = ["live from", "live at", "live in", "live on", "mtv unplugged"]
+        title = self.og_title.lower()
+
         for keyword in keywords:
-            if keyword in self.og_title.lower():
+            if keyword in title:
                 return True
 
         return False
@@ -160,11 +175,12 @@ class Album:
         Checks if the album is a single.
         """
         keywords = ["single version", "- single"]
+        title = self.og_title.lower()
 
         # show_albums_as_singles = get_flag(SessionVarKeys.SHOW_ALBUMS_AS_SINGLES)
 
         for keyword in keywords:
-            if keyword in self.og_title.lower():
+            if keyword in title:
                 return True
 
         # REVIEW: Reading from the config file in a for loop will be slow
@@ -172,14 +188,15 @@ class Album:
         if singleTrackAsSingle and len(tracks) == 1:
             return True
 
-        if (
-            len(tracks) == 1
-            and (
-                create_hash(tracks[0].title) == create_hash(self.title)
-                or create_hash(tracks[0].title) == create_hash(self.og_title)
-            )  # if they have the same title
-            # and tracks[0].track == 1
-            # and tracks[0].disc == 1
-            # TODO: Review -> Are the above commented checks necessary?
-        ):
-            return True
+        if len(tracks) == 1:
+            track_title = create_hash(tracks[0].title)
+
+            if (
+                track_title == create_hash(self.title)
+                or track_title == create_hash(self.og_title)
+                # if they have the same title
+                # and tracks[0].track == 1
+                # and tracks[0].disc == 1
+                # TODO: Review -> Are the above commented checks necessary?
+            ):
+                return True
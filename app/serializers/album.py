@@ -2,9 +2,16 @@ from dataclasses import asdict
 from app.models import Album
 
 
+def album_to_dict(album: Album) -> dict:
+    """
+    Returns the album as a dict, without its private (underscore prefixed) fields.
+    """
+    return {k: v for k, v in asdict(album).items() if not k.startswith("_")}
+
+
 def album_serializer(album: Album, to_remove: set[str]) -> dict:
     try:
-        album_dict = asdict(album)
+        album_dict = album_to_dict(album)
     except TypeError:
         return {}
 
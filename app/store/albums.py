@@ -109,18 +109,17 @@ class AlbumStore:
         Returns N albums by the given albumartist, excluding the specified album.
         """
 
-        albums = [album for album in cls.albums if artisthash in album.artisthashes]
-
+        exclude_hash = create_hash(exclude)
         albums = [
             album
-            for album in albums
-            if create_hash(album.base_title) != create_hash(exclude)
+            for album in cls.get_albums_by_artisthash(artisthash)
+            if artisthash in album.artisthashes
+            and create_hash(album.base_title) != exclude_hash
         ]
 
         if len(albums) > limit:
             random.shuffle(albums)
 
-        # TODO: Merge this with `cls.get_albums_by_artisthash()`
         return albums[:limit]
 
     @classmethod
@@ -144,8 +143,11 @@ class AlbumStore:
         """
         Count albums for the given artisthash.
         """
-        master_string = "-".join(a.albumartists_hashes for a in cls.albums)
-        return master_string.count(artisthash)
+        return sum(
+            1
+            for album in cls.get_albums_by_artisthash(artisthash)
+            if artisthash in album.artisthashes
+        )
 
     # @classmethod
     # def album_exists(cls, albumhash: str) -> bool:
@@ -1,13 +1,16 @@
 import json
+from collections import OrderedDict
+from threading import Lock
 from typing import Iterable
 
 from app.lib.tagger import create_artists
-from app.models import Artist
+from app.models import Album, Artist
 from app.utils.auth import get_current_userid
 from app.utils.customlist import CustomList
 from .tracks import TrackStore
 
 ARTIST_LOAD_KEY = ""
+ARTIST_ALBUMS_CACHE_SIZE = 256
 
 
 class ArtistMapEntry:
@@ -36,6 +39,11 @@ class ArtistMapEntry:
 class ArtistStore:
     artistmap: dict[str, ArtistMapEntry] = {}
 
+    # INFO: Holds the grouped albums of recently viewed artists, keyed by artisthash.
+    # Cleared whenever the tracks, albums or artists in the stores change.
+    albums_cache: OrderedDict[str, dict[str, list[Album]]] = OrderedDict()
+    albums_cache_lock = Lock()
+
     @classmethod
     def load_artists(cls, instance_key: str, _trackhashes: list[str] = []):
         """
@@ -54,6 +62,10 @@ class ArtistStore:
             for artist, trackhashes, albumhashes in create_artists(_trackhashes)
         }
 
+        # INFO: Clear after the new map is in place so that no request
+        # caches albums from the old stores
+        cls.clear_albums_cache()
+
         # for track in TrackStore.get_flat_list():
         #     if instance_key != ARTIST_LOAD_KEY:
         #         return
@@ -76,6 +88,41 @@ class ArtistStore:
         """
         return [a.artist for a in cls.artistmap.values()]
 
+    @classmethod
+    def get_cached_albums(cls, artisthash: str) -> dict[str, list[Album]] | None:
+        """
+        Returns the cached grouped albums for the given artist, if any.
+        """
+        with cls.albums_cache_lock:
+            groups = cls.albums_cache.get(artisthash)
+
+            if groups is not None:
+                cls.albums_cache.move_to_end(artisthash)
+
+            return groups
+
+    @classmethod
+    def cache_albums(cls, artisthash: str, groups: dict[str, list[Album]]):
+        """
+        Caches the grouped albums for the given artist,
+        evicting the least recently used entry when full.
+        """
+        with cls.albums_cache_lock:
+            cls.albums_cache[artisthash] = groups
+            cls.albums_cache.move_to_end(artisthash)
+
+            if len(cls.albums_cache) > ARTIST_ALBUMS_CACHE_SIZE:
+                cls.albums_cache.popitem(last=False)
+
+    @classmethod
+    def clear_albums_cache(cls):
+        """
+        Clears the grouped albums cache. Call this whenever tracks,
+        albums or artists are added to or removed from the stores.
+        """
+        with cls.albums_cache_lock:
+            cls.albums_cache.clear()
+
     # @classmethod
     # def map_artist_color(cls, artist_tuple: tuple):
     #     """
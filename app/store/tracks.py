@@ -85,7 +85,7 @@ class TrackStore:
         """
         return list(
             itertools.chain.from_iterable(
-                [group.tracks for group in cls.trackhashmap.values()]
+                group.tracks for group in cls.trackhashmap.values()
             )
         )
 
@@ -163,20 +163,23 @@ class TrackStore:
 
         filecount = len(filepaths)
 
-        for trackhash in cls.trackhashmap:
-            group = cls.trackhashmap[trackhash]
+        # INFO: Iterate over a copy as emptied groups are deleted from the map
+        for trackhash, group in list(cls.trackhashmap.items()):
+            tracks = [t for t in group.tracks if t.filepath not in filepaths]
+            removed = len(group) - len(tracks)
 
-            for track in group.tracks:
-                if track.filepath in filepaths:
-                    group.remove(track)
+            if removed == 0:
+                continue
 
-                    if len(group) == 0:
-                        del cls.trackhashmap[trackhash]
+            group.tracks = tracks
 
-                    filecount -= 1
+            if len(group) == 0:
+                del cls.trackhashmap[trackhash]
 
-                if filecount == 0:
-                    break
+            filecount -= removed
+
+            if filecount <= 0:
+                break
 
     @classmethod
     def count_tracks_by_trackhash(cls, trackhash: str) -> int:
@@ -194,21 +197,17 @@ class TrackStore:
         """
         Returns a list of tracks by their hashes.
         """
-        hash_set = set(trackhashes)
-
         tracks: list[Track] = []
 
-        for trackhash in hash_set:
+        # INFO: dict.fromkeys removes duplicate hashes while keeping
+        # the tracks in the order of the given trackhashes
+        for trackhash in dict.fromkeys(trackhashes):
             group = cls.trackhashmap.get(trackhash, None)
 
             if group:
                 track = group.get_best()
                 tracks.append(track)
 
-        # sort the tracks in the order of the given trackhashes
-        if type(trackhashes) == list:
-            tracks.sort(key=lambda t: trackhashes.index(t.trackhash))
-
         return tracks
 
     @classmethod
@@ -221,18 +220,18 @@ class TrackStore:
         # return [track for track in tracks if track is not None]
         # return cls.find_tracks_by(key="filepath", value=paths)
 
+        path_set = set(paths)
         tracks: list[Track] = []
 
-        for trackhash in cls.trackhashmap:
-            group = cls.trackhashmap.get(trackhash)
-
-            if not group:
-                continue
-
+        for group in cls.trackhashmap.values():
             for track in group.tracks:
-                if track.filepath in paths:
+                if track.filepath in path_set:
                     tracks.append(track)
 
+                    # INFO: Each filepath maps to a single track
+                    if len(tracks) == len(path_set):
+                        return tracks
+
         return tracks
 
     @classmethod
@@ -0,0 +1,42 @@
+from typing import Any
+
+import orjson
+from flask.json.provider import JSONProvider
+
+
+def _default(obj: Any):
+    """
+    Serializes types that orjson does not support natively.
+    """
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class OrjsonProvider(JSONProvider):
+    """
+    A Flask JSON provider that uses orjson to encode and decode JSON.
+
+    Dataclasses (Track, Album, Artist, etc.) are serialized natively by orjson.
+    """
+
+    sort_keys: bool = False
+    """Sort the keys of all serialized dicts."""
+
+    compact: bool = True
+    """Omit indentation. Set to False to pretty print responses."""
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        option = orjson.OPT_NON_STR_KEYS
+
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+
+        if not self.compact:
+            option |= orjson.OPT_INDENT_2
+
+        return orjson.dumps(obj, option=option, default=_default).decode()
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        return orjson.loads(s)
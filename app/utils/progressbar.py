@@ -8,6 +8,9 @@ def tqdm(*args, **kwargs):
     bar_format = "{percentage:3.0f}%|{bar:45}|{n_fmt}/{total_fmt}{desc}"
     kwargs["bar_format"] = bar_format
 
+    # INFO: Redraw less often so terminal I/O doesn't dominate tight loops
+    kwargs.setdefault("mininterval", 0.5)
+
     if "desc" in kwargs:
         print(f'INFO|{kwargs["desc"].capitalize()} ...')
         kwargs["desc"] = ""
@@ -0,0 +1,116 @@
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from app.api.artist import get_grouped_artist_albums
+from app.lib import watchdogg
+from app.models.album import Album
+from app.store.albums import AlbumMapEntry, AlbumStore
+from app.store.artists import ArtistMapEntry, ArtistStore
+from app.store.tracks import TrackGroup, TrackStore
+
+
+def create_track(trackhash: str, title: str, artisthash: str):
+    return SimpleNamespace(
+        trackhash=trackhash,
+        albumhash="hit",
+        title=title,
+        filepath=f"/music/{trackhash}.mp3",
+        bitrate=320,
+        duration=200,
+        artisthashes=[artisthash],
+    )
+
+
+class TestArtistAlbumsCache(unittest.TestCase):
+    def setUp(self):
+        self.stores = (
+            TrackStore.trackhashmap,
+            AlbumStore.albummap,
+            ArtistStore.artistmap,
+        )
+
+        # INFO: "Hit" by Main, with a single track featuring Singer
+        self.album = Album(
+            albumartists=[{"name": "Main", "artisthash": "main"}],
+            albumhash="hit",
+            artisthashes=["main"],
+            base_title="Hit",
+            color="",
+            created_date=0,
+            date=0,
+            duration=200,
+            genres=[],
+            genrehashes=[],
+            og_title="Hit",
+            title="Hit",
+            trackcount=1,
+            lastplayed=0,
+            playcount=0,
+            playduration=0,
+            extra={},
+        )
+
+        TrackStore.trackhashmap = {
+            "t1": TrackGroup([create_track("t1", "Hit", "singer")])
+        }
+        AlbumStore.albummap = {"hit": AlbumMapEntry(self.album, {"t1"})}
+        ArtistStore.artistmap = {
+            "singer": ArtistMapEntry(
+                artist=SimpleNamespace(name="Singer"),
+                albumhashes={"hit"},
+                trackhashes={"t1"},
+            )
+        }
+        ArtistStore.clear_albums_cache()
+
+    def tearDown(self):
+        (
+            TrackStore.trackhashmap,
+            AlbumStore.albummap,
+            ArtistStore.artistmap,
+        ) = self.stores
+        ArtistStore.clear_albums_cache()
+
+    def get_singer_albums(self):
+        return get_grouped_artist_albums("singer", ArtistStore.artistmap["singer"])
+
+    def test_cached_albums_are_reused(self):
+        groups = self.get_singer_albums()
+
+        self.assertIs(self.get_singer_albums(), groups)
+
+    def test_add_track_clears_cache(self):
+        self.assertEqual(self.get_singer_albums()["singles_and_eps"], [self.album])
+
+        tags = vars(create_track("t2", "Another Song", "other"))
+
+        with patch.object(watchdogg, "get_tags", return_value=tags), patch.object(
+            watchdogg, "TrackTable"
+        ), patch.object(watchdogg, "extract_thumb"), patch.object(
+            watchdogg, "handle_color", return_value=None
+        ), patch.object(
+            watchdogg, "Track", side_effect=lambda **kw: SimpleNamespace(**kw)
+        ), patch.object(
+            watchdogg, "create_artists", return_value=[]
+        ):
+            watchdogg.add_track(tags["filepath"])
+
+        # INFO: Singer's entry is untouched, but the album is now a 2 track album
+        groups = self.get_singer_albums()
+
+        self.assertEqual(self.album.type, "album")
+        self.assertEqual(groups["singles_and_eps"], [])
+        self.assertEqual(groups["appearances"], [self.album])
+
+    def test_load_artists_clears_cache(self):
+        self.get_singer_albums()
+
+        with patch("app.store.artists.create_artists", return_value=[]):
+            ArtistStore.load_artists("key")
+
+        self.assertEqual(len(ArtistStore.albums_cache), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,44 @@
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from app.lib.searchlib import TopResults
+from app.store.albums import AlbumStore
+from app.store.artists import ArtistStore
+from app.store.tracks import TrackStore
+
+
+class TestTopResults(unittest.TestCase):
+    def setUp(self):
+        self.artist = SimpleNamespace(name="The Beatles")
+        self.track = SimpleNamespace(og_title="Come Together")
+        self.album = SimpleNamespace(title="Abbey Road")
+
+        self.patches = [
+            patch.object(ArtistStore, "get_flat_list", return_value=[self.artist]),
+            patch.object(TrackStore, "get_flat_list", return_value=[self.track]),
+            patch.object(AlbumStore, "get_flat_list", return_value=[self.album]),
+        ]
+
+        for p in self.patches:
+            p.start()
+
+    def tearDown(self):
+        for p in self.patches:
+            p.stop()
+
+    def test_collect_all_includes_each_store_once(self):
+        items, titles = TopResults.collect_all()
+
+        self.assertEqual(items, [self.artist, self.track, self.album])
+        self.assertEqual(titles, ["The Beatles", "Come Together", "Abbey Road"])
+
+    def test_album_can_be_top_result(self):
+        items, titles = TopResults.collect_all()
+        results = TopResults.get_results(titles, "abbey road")
+
+        self.assertIs(items[results[0][2]], self.album)
+
+
+if __name__ == "__main__":
+    unittest.main()